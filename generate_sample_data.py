@@ -4,9 +4,10 @@
 Generates realistic fake data for healthcare insurance analytics dashboard.
 """
 
+import argparse
 import os
-import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 
@@ -14,8 +15,7 @@ import numpy as np
 import pandas as pd
 
 # Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
 
 # Configuration
 NUM_MEMBERS = 1200
@@ -24,6 +24,12 @@ NUM_PROVIDERS = 250
 NUM_EMPLOYERS = 25
 MONTHS_OF_DATA = 24  # 2 years
 
+# Low-cardinality label columns stored as categoricals
+CATEGORICAL_COLUMNS = [
+    'Service Type', 'status', 'member_type', 'diagnosis_category', 'gender',
+    'industry', 'size', 'provider_type', 'specialty'
+]
+
 # Common first and last names for realistic data
 FIRST_NAMES = [
     "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
@@ -53,6 +59,11 @@ CITIES = [
     ("Miami", "FL", "33101"), ("Atlanta", "GA", "30301"), ("Minneapolis", "MN", "55401")
 ]
 
+# Column-wise views of CITIES for vectorized lookups
+CITY_NAMES = np.array([c[0] for c in CITIES])
+CITY_STATES = np.array([c[1] for c in CITIES])
+CITY_ZIPS = np.array([c[2] for c in CITIES])
+
 COMPANY_NAMES = [
     "Acme Corporation", "TechCorp Solutions", "Global Industries", "Premier Manufacturing",
     "Innovative Systems", "Digital Dynamics", "Alpha Enterprises", "Omega Holdings",
@@ -115,32 +126,41 @@ DRUG_NAMES = [
     ("Apixaban", "Blood thinner", 400, 600)
 ]
 
-def generate_phone() -> str:
-    """Generate random phone number."""
-    return f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}"
+def generate_phones(n: int) -> np.ndarray:
+    """Generate n random phone numbers."""
+    area = pd.Series(rng.integers(200, 1000, n).astype(str))
+    exchange = pd.Series(rng.integers(200, 1000, n).astype(str))
+    line = pd.Series(rng.integers(1000, 10000, n).astype(str))
+    return ("(" + area + ") " + exchange + "-" + line).to_numpy()
 
-def generate_email(first_name: str, last_name: str) -> str:
-    """Generate email from name."""
-    domains = ["gmail.com", "yahoo.com", "outlook.com", "email.com", "mail.com"]
-    return f"{first_name.lower()}.{last_name.lower()}@{random.choice(domains)}"
+def generate_emails(first_names: np.ndarray, last_names: np.ndarray) -> np.ndarray:
+    """Generate emails from parallel arrays of names."""
+    domains = np.array(["gmail.com", "yahoo.com", "outlook.com", "email.com", "mail.com"])
+    picks = domains[rng.integers(0, len(domains), len(first_names))]
+    return (pd.Series(first_names).str.lower() + "." + pd.Series(last_names).str.lower()
+            + "@" + picks).to_numpy()
 
-def generate_address() -> str:
-    """Generate random street address."""
-    street_nums = range(100, 9999)
-    street_names = [
+def generate_addresses(n: int) -> np.ndarray:
+    """Generate n random street addresses."""
+    street_names = np.array([
         "Main", "Oak", "Maple", "First", "Second", "Third", "Park", "Pine",
         "Elm", "Washington", "Lake", "Hill", "Forest", "River", "Sunset"
-    ]
-    street_types = ["St", "Ave", "Rd", "Blvd", "Dr", "Ln", "Way", "Ct"]
+    ])
+    street_types = np.array(["St", "Ave", "Rd", "Blvd", "Dr", "Ln", "Way", "Ct"])
     
-    return f"{random.choice(street_nums)} {random.choice(street_names)} {random.choice(street_types)}"
+    nums = pd.Series(rng.integers(100, 9999, n).astype(str))
+    names = street_names[rng.integers(0, len(street_names), n)]
+    types = street_types[rng.integers(0, len(street_types), n)]
+    return (nums + " " + names + " " + types).to_numpy()
+
+def generate_ids(prefix: str, start: int, n: int, width: int) -> np.ndarray:
+    """Generate n sequential zero-padded ids, e.g. MEM000001."""
+    numbers = pd.Series(np.arange(start, start + n).astype(str))
+    return (prefix + numbers.str.zfill(width)).to_numpy()
 
-def generate_date_range(start_date: datetime, end_date: datetime) -> datetime:
-    """Generate random date between start and end."""
-    time_between = end_date - start_date
-    days_between = time_between.days
-    random_days = random.randrange(days_between)
-    return start_date + timedelta(days=random_days)
+def categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality label columns as pandas categoricals."""
+    return df.astype({col: 'category' for col in CATEGORICAL_COLUMNS if col in df})
 
 def generate_reference_data() -> tuple[pd.DataFrame, ...]:
     """Generate reference/lookup tables."""
@@ -151,7 +171,7 @@ def generate_reference_data() -> tuple[pd.DataFrame, ...]:
         'service_type_id': range(1, len(SERVICE_TYPES) + 1),
         'service_type': SERVICE_TYPES,
         'category': ['Medical'] * 11 + ['Ancillary'] * 5,
-        'requires_auth': [random.choice([True, False]) for _ in SERVICE_TYPES],
+        'requires_auth': rng.choice([True, False], size=len(SERVICE_TYPES)),
         'typical_cost_min': [100, 500, 5000, 2000, 50, 150, 400, 10000, 200, 100, 1000, 300, 200, 150, 500, 800],
         'typical_cost_max': [2000, 5000, 50000, 15000, 500, 1000, 3000, 100000, 1500, 500, 10000, 2000, 1500, 800, 5000, 5000]
     })
@@ -159,8 +179,9 @@ def generate_reference_data() -> tuple[pd.DataFrame, ...]:
     # ICD-10 Codes
     icd10_df = pd.DataFrame(ICD10_CODES, columns=['icd10_code', 'medical_description', 'laymans_term'])
     icd10_df['diagnosis_category'] = ['Chronic'] * 10 + ['Acute'] * 10
-    icd10_df['hcc_code'] = [f"HCC{random.randint(1,200)}" if random.random() > 0.5 else None for _ in range(len(ICD10_CODES))]
-    icd10_df['risk_weight'] = [round(random.uniform(0.5, 3.5), 2) for _ in range(len(ICD10_CODES))]
+    icd10_df['hcc_code'] = np.where(rng.random(len(ICD10_CODES)) > 0.5,
+                                    np.char.add("HCC", rng.integers(1, 201, len(ICD10_CODES)).astype(str)), None)
+    icd10_df['risk_weight'] = np.round(rng.uniform(0.5, 3.5, len(ICD10_CODES)), 2)
     
     # Plan Types
     plan_types_df = pd.DataFrame({
@@ -181,22 +202,22 @@ def generate_reference_data() -> tuple[pd.DataFrame, ...]:
         'region_name': [f"Region {i}" for i in range(1, 51)],
         'country': ['USA'] * 40 + ['Canada'] * 5 + ['Mexico'] * 3 + ['UK'] * 1 + ['Japan'] * 1,
         'domestic_flag': [True] * 40 + [False] * 10,
-        'cost_index': [round(random.uniform(0.8, 1.3), 2) for _ in range(50)]
+        'cost_index': np.round(rng.uniform(0.8, 1.3, 50), 2)
     })
     
     # Employer Groups
     employer_df = pd.DataFrame({
         'employer_group_id': range(1, NUM_EMPLOYERS + 1),
         'company_name': COMPANY_NAMES[:NUM_EMPLOYERS],
-        'industry': random.choices(['Technology', 'Manufacturing', 'Healthcare', 'Finance', 
-                                   'Retail', 'Education', 'Government'], k=NUM_EMPLOYERS),
-        'size': random.choices(['Small (1-99)', 'Medium (100-999)', 'Large (1000+)'], 
-                               weights=[0.5, 0.35, 0.15], k=NUM_EMPLOYERS),
+        'industry': rng.choice(['Technology', 'Manufacturing', 'Healthcare', 'Finance',
+                                'Retail', 'Education', 'Government'], size=NUM_EMPLOYERS),
+        'size': rng.choice(['Small (1-99)', 'Medium (100-999)', 'Large (1000+)'],
+                           size=NUM_EMPLOYERS, p=[0.5, 0.35, 0.15]),
         'effective_date': pd.date_range(start='2020-01-01', periods=NUM_EMPLOYERS, freq='M'),
         'status': ['Active'] * (NUM_EMPLOYERS - 2) + ['Terminated'] * 2
     })
     
-    return service_types_df, icd10_df, plan_types_df, regions_df, employer_df
+    return service_types_df, categorize(icd10_df), plan_types_df, regions_df, categorize(employer_df)
 
 def generate_providers():
     """Generate provider data"""
@@ -206,274 +227,359 @@ def generate_providers():
     specialties = ['Primary Care', 'Cardiology', 'Orthopedics', 'Neurology', 'Oncology', 
                   'Pediatrics', 'OB/GYN', 'Emergency', 'General', 'Internal Medicine']
     
-    providers = []
-    for i in range(NUM_PROVIDERS):
-        city_data = random.choice(CITIES)
-        providers.append({
-            'provider_id': f"PRV{str(i+1).zfill(5)}",
-            'provider_name': f"{random.choice(['St.', 'Mount', 'Valley', 'City', 'Regional'])} {random.choice(['General', 'Memorial', 'Community', 'Medical'])} {random.choice(['Hospital', 'Center', 'Clinic', 'Associates'])}",
-            'provider_type': random.choice(provider_types),
-            'specialty': random.choice(specialties),
-            'address': generate_address(),
-            'city': city_data[0],
-            'state': city_data[1],
-            'zip': city_data[2],
-            'phone': generate_phone(),
-            'in_network': random.random() > 0.2,  # 80% in-network
-            'quality_rating': round(random.uniform(3.0, 5.0), 1),
-            'avg_cost_index': round(random.uniform(0.7, 1.5), 2)
-        })
-    
-    return pd.DataFrame(providers)
+    provider_ids = generate_ids("PRV", 1, NUM_PROVIDERS, 5)
+    addresses = generate_addresses(NUM_PROVIDERS)
+    phones = generate_phones(NUM_PROVIDERS)
+    city_idx = rng.integers(0, len(CITIES), NUM_PROVIDERS)
+    
+    name_prefixes = np.array(['St.', 'Mount', 'Valley', 'City', 'Regional'])
+    name_middles = np.array(['General', 'Memorial', 'Community', 'Medical'])
+    name_suffixes = np.array(['Hospital', 'Center', 'Clinic', 'Associates'])
+    provider_names = (pd.Series(name_prefixes[rng.integers(0, len(name_prefixes), NUM_PROVIDERS)])
+                      + " " + name_middles[rng.integers(0, len(name_middles), NUM_PROVIDERS)]
+                      + " " + name_suffixes[rng.integers(0, len(name_suffixes), NUM_PROVIDERS)])
+    
+    providers_df = pd.DataFrame({
+        'provider_id': provider_ids,
+        'provider_name': provider_names.to_numpy(),
+        'provider_type': np.array(provider_types)[rng.integers(0, len(provider_types), NUM_PROVIDERS)],
+        'specialty': np.array(specialties)[rng.integers(0, len(specialties), NUM_PROVIDERS)],
+        'address': addresses,
+        'city': CITY_NAMES[city_idx],
+        'state': CITY_STATES[city_idx],
+        'zip': CITY_ZIPS[city_idx],
+        'phone': phones,
+        'in_network': rng.random(NUM_PROVIDERS) > 0.2,  # 80% in-network
+        'quality_rating': np.round(rng.uniform(3.0, 5.0, NUM_PROVIDERS), 1),
+        'avg_cost_index': np.round(rng.uniform(0.7, 1.5, NUM_PROVIDERS), 2)
+    })
+    
+    return categorize(providers_df)
 
 def generate_members(employer_df, plan_types_df):
     """Generate member/enrollment data"""
     print("Generating member data...")
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    members = []
     claimant_counter = 100000
+    employer_ids = employer_df['employer_group_id'].to_numpy()
+    plan_ids = plan_types_df['plan_type_id'].to_numpy()
+    
+    first_names = np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), NUM_MEMBERS)]
+    last_names = np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), NUM_MEMBERS)]
+    city_idx = rng.integers(0, len(CITIES), NUM_MEMBERS)
+    
+    # Age distribution: working age population
+    ages = np.clip(rng.normal(45, 15, NUM_MEMBERS).astype(int), 18, 85)
+    dob = pd.Timestamp.now() - pd.to_timedelta(ages * 365, unit='D')
+    
+    # Enrollment dates
+    enrollment_start = datetime(2020, 1, 1)
+    enrollment_days = (datetime(2023, 6, 1) - enrollment_start).days
+    enrollment_dates = pd.Timestamp(enrollment_start) + pd.to_timedelta(
+        rng.integers(0, enrollment_days, NUM_MEMBERS), unit='D')
+    is_active = rng.random(NUM_MEMBERS) > 0.2  # 80% active
+    termination_dates = enrollment_dates + pd.to_timedelta(
+        rng.integers(90, 731, NUM_MEMBERS), unit='D')
+    
+    # Member type based on age
+    member_types = np.where(ages >= 65, "Retiree",
+                            np.where(rng.random(NUM_MEMBERS) > 0.7, "Dependent", "Employee"))
+    
+    # Risk scoring based on age and random factors
+    base_risk = 0.5 + (ages / 100) * 2
+    risk_scores = np.round(base_risk * rng.uniform(0.5, 2.0, NUM_MEMBERS), 2)
+    
+    members_df = pd.DataFrame({
+        'member_id': generate_ids("MEM", 1, NUM_MEMBERS, 6),
+        'claimant_number': (claimant_counter + np.arange(NUM_MEMBERS)).astype(str),
+        'first_name': first_names,
+        'last_name': last_names,
+        'dob': dob.strftime('%Y-%m-%d'),
+        'age': ages.astype('int16'),
+        'gender': rng.choice(['M', 'F'], NUM_MEMBERS),
+        'email': generate_emails(first_names, last_names),
+        'phone': generate_phones(NUM_MEMBERS),
+        'address': generate_addresses(NUM_MEMBERS),
+        'city': CITY_NAMES[city_idx],
+        'state': CITY_STATES[city_idx],
+        'zip': CITY_ZIPS[city_idx],
+        'employer_group_id': rng.choice(employer_ids, NUM_MEMBERS),
+        'plan_type_id': rng.choice(plan_ids, NUM_MEMBERS),
+        'enrollment_date': enrollment_dates.strftime('%Y-%m-%d'),
+        'termination_date': np.where(is_active, None, termination_dates.strftime('%Y-%m-%d')),
+        'member_type': member_types,
+        'dependent_count': np.where(member_types == "Employee", rng.integers(0, 5, NUM_MEMBERS), 0).astype('int8'),
+        'risk_score': risk_scores.astype('float32'),
+        'chronic_conditions': np.where(risk_scores > 1.5, rng.integers(0, 4, NUM_MEMBERS), 0).astype('int8'),
+        'status': np.where(is_active, 'Active', 'Terminated'),
+        'created_at': enrollment_dates.strftime('%Y-%m-%d %H:%M:%S'),
+        'updated_at': now_str
+    })
     
-    for i in range(NUM_MEMBERS):
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        city_data = random.choice(CITIES)
-        
-        # Age distribution: working age population
-        age = np.random.normal(45, 15)
-        age = max(18, min(85, int(age)))
-        dob = datetime.now() - timedelta(days=age*365)
-        
-        # Enrollment dates
-        enrollment_date = generate_date_range(datetime(2020, 1, 1), datetime(2023, 6, 1))
-        is_active = random.random() > 0.2  # 80% active
-        termination_date = None if is_active else enrollment_date + timedelta(days=random.randint(90, 730))
-        
-        # Member type based on age
-        if age >= 65:
-            member_type = "Retiree"
-        elif random.random() > 0.7:
-            member_type = "Dependent"
-        else:
-            member_type = "Employee"
-        
-        # Risk scoring based on age and random factors
-        base_risk = 0.5 + (age / 100) * 2
-        risk_score = round(base_risk * random.uniform(0.5, 2.0), 2)
-        
-        members.append({
-            'member_id': f"MEM{str(i+1).zfill(6)}",
-            'claimant_number': str(claimant_counter + i),
-            'first_name': first_name,
-            'last_name': last_name,
-            'dob': dob.strftime('%Y-%m-%d'),
-            'age': age,
-            'gender': random.choice(['M', 'F']),
-            'email': generate_email(first_name, last_name),
-            'phone': generate_phone(),
-            'address': generate_address(),
-            'city': city_data[0],
-            'state': city_data[1],
-            'zip': city_data[2],
-            'employer_group_id': random.choice(employer_df['employer_group_id'].tolist()),
-            'plan_type_id': random.choice(plan_types_df['plan_type_id'].tolist()),
-            'enrollment_date': enrollment_date.strftime('%Y-%m-%d'),
-            'termination_date': termination_date.strftime('%Y-%m-%d') if termination_date else None,
-            'member_type': member_type,
-            'dependent_count': random.randint(0, 4) if member_type == "Employee" else 0,
-            'risk_score': risk_score,
-            'chronic_conditions': random.randint(0, 3) if risk_score > 1.5 else 0,
-            'status': 'Active' if is_active else 'Terminated',
-            'created_at': enrollment_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    return pd.DataFrame(members)
-
-def generate_claims(members_df, providers_df, icd10_df, service_types_df):
-    """Generate claims data with realistic distributions"""
+    # Hand the generated dates to claims and budget generation so they need not re-parse
+    member_dates = (enrollment_dates, termination_dates.where(~is_active))
+    return categorize(members_df), member_dates
+
+def parse_member_dates(members_df):
+    """Parse enrollment and termination dates from a members frame's string columns."""
+    return (pd.DatetimeIndex(pd.to_datetime(members_df['enrollment_date'])),
+            pd.DatetimeIndex(pd.to_datetime(members_df['termination_date'])))
+
+def generate_claims(members_df, providers_df, icd10_df, service_types_df, member_dates=None):
+    """Generate claims data with realistic distributions
+
+    member_dates is the (enrollment, termination) pair returned by
+    generate_members; it is parsed from members_df when not given.
+    """
     print("Generating claims data...")
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    claims = []
     claim_id_counter = 1000000
     
     # Create weighted member selection (high utilizers)
-    member_weights = members_df['risk_score'].values
+    member_weights = members_df['risk_score'].to_numpy(dtype=float)
     member_weights = member_weights / member_weights.sum()
     
-    for i in range(NUM_CLAIMS):
-        # Select member (weighted by risk score)
-        member = members_df.sample(n=1, weights=member_weights).iloc[0]
-        
-        # Service date within member's enrollment period
-        start_date = datetime.strptime(member['enrollment_date'], '%Y-%m-%d')
-        end_date = datetime.now()
-        if member['termination_date']:
-            end_date = datetime.strptime(member['termination_date'], '%Y-%m-%d')
-        
-        service_date = generate_date_range(start_date, end_date)
-        
-        # Select service type and costs
-        service_type = random.choice(SERVICE_TYPES)
-        service_info = service_types_df[service_types_df['service_type'] == service_type].iloc[0]
-        
-        # Generate costs based on service type
-        if service_type == "Pharmacy":
-            drug_info = random.choice(DRUG_NAMES)
-            medical_cost = 0
-            rx_cost = random.uniform(drug_info[2], drug_info[3])
-            icd_code = "Z79.899"  # Long term drug therapy
-            med_desc = f"Prescription: {drug_info[0]}"
-            layman = drug_info[1]
-        else:
-            medical_cost = random.uniform(service_info['typical_cost_min'], service_info['typical_cost_max'])
-            # Add outliers (5% chance of high cost)
-            if random.random() < 0.05:
-                medical_cost *= random.uniform(5, 20)
-            rx_cost = 0
-            icd_info = random.choice(ICD10_CODES)
-            icd_code = icd_info[0]
-            med_desc = icd_info[1]
-            layman = icd_info[2]
-        
-        total_cost = medical_cost + rx_cost
-        
-        # Domestic vs non-domestic (85% domestic)
-        domestic_flag = random.random() < 0.85
-        
-        # Payment status
-        status = random.choices(['Paid', 'Pending', 'Denied'], weights=[0.85, 0.10, 0.05])[0]
-        
-        claims.append({
-            'claim_id': f"CLM{str(claim_id_counter + i).zfill(7)}",
-            'claimant_number': member['claimant_number'],
-            'member_id': member['member_id'],
-            'service_date': service_date.strftime('%Y-%m-%d'),
-            'Service Type': service_type,  # Capital S and T to match expected format
-            'provider_id': random.choice(providers_df['provider_id'].tolist()),
-            'ICD-10-CM Code': icd_code,  # Exact format expected
-            'Medical Description': med_desc,  # Capital M and D
-            "Layman's Term": layman,  # Exact format with apostrophe
-            'Medical': round(medical_cost, 2),  # Capital M
-            'Rx': round(rx_cost, 2),  # Capital R
-            'Total': round(total_cost, 2),  # Capital T
-            'domestic_flag': domestic_flag,
-            'plan_type_id': member['plan_type_id'],
-            'diagnosis_category': 'Chronic' if member['chronic_conditions'] > 0 else 'Acute',
-            'hcc_code': f"HCC{random.randint(1,200)}" if random.random() > 0.6 else None,
-            'risk_score': member['risk_score'],
-            'paid_date': (service_date + timedelta(days=random.randint(15, 45))).strftime('%Y-%m-%d') if status == 'Paid' else None,
-            'status': status,
-            'created_at': service_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
+    # Select all claim members at once (weighted by risk score)
+    member_idx = rng.choice(len(members_df), size=NUM_CLAIMS, p=member_weights)
+    claimant_numbers = members_df['claimant_number'].to_numpy()[member_idx]
+    member_ids = members_df['member_id'].to_numpy()[member_idx]
+    plan_type_ids = members_df['plan_type_id'].to_numpy()[member_idx]
+    risk_scores = members_df['risk_score'].to_numpy()[member_idx]
+    chronic_conditions = members_df['chronic_conditions'].to_numpy()[member_idx]
+    
+    # Cost bounds aligned to SERVICE_TYPES order, looked up by position
+    cost_bounds = (service_types_df.set_index('service_type')
+                   .loc[SERVICE_TYPES, ['typical_cost_min', 'typical_cost_max']]
+                   .to_numpy(dtype=float))
+    min_arr, max_arr = cost_bounds[:, 0], cost_bounds[:, 1]
+    
+    # Select service types and costs
+    svc_idx = rng.integers(0, len(SERVICE_TYPES), NUM_CLAIMS)
+    service_types = np.array(SERVICE_TYPES)[svc_idx]
+    is_pharmacy = svc_idx == SERVICE_TYPES.index("Pharmacy")
+    
+    medical_cost = rng.uniform(min_arr[svc_idx], max_arr[svc_idx])
+    # Add outliers (5% chance of high cost)
+    outlier = rng.random(NUM_CLAIMS) < 0.05
+    medical_cost[outlier] *= rng.uniform(5, 20, outlier.sum())
+    medical_cost[is_pharmacy] = 0
+    
+    # Pharmacy claims carry a drug cost, everything else a diagnosis
+    drug_idx = rng.integers(0, len(DRUG_NAMES), NUM_CLAIMS)
+    drug_names = np.array([d[0] for d in DRUG_NAMES])[drug_idx]
+    drug_uses = np.array([d[1] for d in DRUG_NAMES])[drug_idx]
+    drug_min = np.array([d[2] for d in DRUG_NAMES], dtype=float)[drug_idx]
+    drug_max = np.array([d[3] for d in DRUG_NAMES], dtype=float)[drug_idx]
+    rx_cost = np.where(is_pharmacy, rng.uniform(drug_min, drug_max), 0.0)
+    
+    icd_idx = rng.integers(0, len(ICD10_CODES), NUM_CLAIMS)
+    icd_codes = np.where(is_pharmacy, "Z79.899", np.array([c[0] for c in ICD10_CODES])[icd_idx])  # Long term drug therapy
+    med_descs = np.where(is_pharmacy, np.char.add("Prescription: ", drug_names),
+                         np.array([c[1] for c in ICD10_CODES])[icd_idx])
+    laymans = np.where(is_pharmacy, drug_uses, np.array([c[2] for c in ICD10_CODES])[icd_idx])
+    
+    total_cost = medical_cost + rx_cost
+    
+    provider_ids = rng.choice(providers_df['provider_id'].to_numpy(), NUM_CLAIMS)
+    
+    # Service date within member's enrollment period
+    if member_dates is None:
+        member_dates = parse_member_dates(members_df)
+    enroll_d = member_dates[0].to_numpy().astype('datetime64[D]')
+    term_d = member_dates[1].to_numpy().astype('datetime64[D]')
+    end_d = np.where(np.isnat(term_d), np.datetime64('today', 'D'), term_d)
+    start_d = enroll_d[member_idx]
+    spans = (end_d[member_idx] - start_d).astype('int64')
+    offsets = (rng.random(NUM_CLAIMS) * spans).astype('int64')
+    service_dates = pd.DatetimeIndex(start_d + offsets.astype('timedelta64[D]'))
+    
+    # Payment status, paid 15-45 days after service
+    statuses = rng.choice(np.array(['Paid', 'Pending', 'Denied']), size=NUM_CLAIMS, p=[0.85, 0.10, 0.05])
+    paid_offsets = pd.to_timedelta(rng.integers(15, 46, NUM_CLAIMS), unit='D')
+    paid_dates = np.where(statuses == 'Paid', (service_dates + paid_offsets).strftime('%Y-%m-%d'), None)
+    
+    # Domestic vs non-domestic (85% domestic)
+    domestic_flags = rng.random(NUM_CLAIMS) < 0.85
+    hcc_mask = rng.random(NUM_CLAIMS) > 0.6
+    hcc_codes = np.where(hcc_mask, np.char.add("HCC", rng.integers(1, 201, NUM_CLAIMS).astype(str)), None)
+    
+    claims_df = pd.DataFrame({
+        'claim_id': generate_ids("CLM", claim_id_counter, NUM_CLAIMS, 7),
+        'claimant_number': claimant_numbers,
+        'member_id': member_ids,
+        'service_date': service_dates.strftime('%Y-%m-%d'),
+        'Service Type': service_types,  # Capital S and T to match expected format
+        'provider_id': provider_ids,
+        'ICD-10-CM Code': icd_codes,  # Exact format expected
+        'Medical Description': med_descs,  # Capital M and D
+        "Layman's Term": laymans,  # Exact format with apostrophe
+        'Medical': np.round(medical_cost, 2),  # Capital M
+        'Rx': np.round(rx_cost, 2),  # Capital R
+        'Total': np.round(total_cost, 2),  # Capital T
+        'domestic_flag': domestic_flags,
+        'plan_type_id': plan_type_ids,
+        'diagnosis_category': np.where(chronic_conditions > 0, 'Chronic', 'Acute'),
+        'hcc_code': hcc_codes,
+        'risk_score': risk_scores,
+        'paid_date': paid_dates,
+        'status': statuses,
+        'created_at': service_dates.strftime('%Y-%m-%d %H:%M:%S'),
+        'updated_at': now_str
+    })
     
     # Add required "Claimant Number" column (without underscore)
-    claims_df = pd.DataFrame(claims)
     claims_df['Claimant Number'] = claims_df['claimant_number']  # Duplicate with exact expected name
     
-    return claims_df
+    return categorize(claims_df), service_dates
+
+def count_active(enroll_sorted: np.ndarray, term_sorted: np.ndarray,
+                 month_starts: pd.DatetimeIndex, month_ends: pd.DatetimeIndex) -> np.ndarray:
+    """Count members enrolled by each month end and not terminated before its start.
+
+    Termination always follows enrollment, so everyone terminated before the
+    month started is also among those enrolled by its end.
+    """
+    enrolled = np.searchsorted(enroll_sorted, month_ends.to_numpy(), side='right')
+    terminated = np.searchsorted(term_sorted, month_starts.to_numpy(), side='left')
+    return enrolled - terminated
 
-def generate_budget_data(claims_df, members_df):
-    """Generate monthly budget and financial data"""
+def generate_budget_data(claims_df, members_df, service_dates=None, member_dates=None):
+    """Generate monthly budget and financial data
+
+    service_dates and member_dates are the dates returned alongside the
+    claims and members frames; they are parsed from the frames when not given.
+    """
     print("Generating budget data...")
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Generate monthly dates
     start_date = datetime.now() - timedelta(days=730)  # 2 years ago
     months = pd.date_range(start=start_date, periods=MONTHS_OF_DATA, freq='M')
+    periods = months.to_period('M')
+    
+    # Aggregate claims by month in a single pass
+    if service_dates is None:
+        service_dates = pd.DatetimeIndex(pd.to_datetime(claims_df['service_date']))
+    period_claims = claims_df.assign(_p=service_dates.to_period('M'))
+    by_service = (
+        period_claims.groupby(['_p', 'Service Type'], observed=True)[['Medical', 'Rx']].sum()
+        .unstack(fill_value=0)
+        .reindex(periods, fill_value=0)
+    )
+    by_domestic = (
+        period_claims.groupby(['_p', 'domestic_flag'])['Total'].sum()
+        .unstack(fill_value=0)
+        .reindex(periods, fill_value=0)
+    )
+    medical_by_type = by_service['Medical']
+    monthly_claims = pd.DataFrame({
+        'medical_claims': medical_by_type.drop(columns='Pharmacy', errors='ignore').sum(axis=1),
+        'rx_claims': by_service['Rx'].get('Pharmacy', 0),
+        'inpatient': medical_by_type.get('Inpatient', 0),
+        'outpatient': medical_by_type.get('Outpatient', 0),
+        'professional': medical_by_type.get('Professional', 0),
+        'emergency': medical_by_type.get('Emergency', 0),
+        'domestic_claims': by_domestic.get(True, 0),
+        'non_domestic_claims': by_domestic.get(False, 0)
+    }, index=periods)
+    
+    # Sort member dates once per member type so each month's enrollment count
+    # is a pair of binary searches instead of a scan over every member
+    if member_dates is None:
+        member_dates = parse_member_dates(members_df)
+    enrollment_dates = member_dates[0].to_numpy()
+    termination_dates = member_dates[1].fillna(pd.Timestamp.max).to_numpy()
+    member_types = members_df['member_type'].to_numpy()
+    sorted_dates = {
+        member_type: (np.sort(enrollment_dates[member_types == member_type]),
+                      np.sort(termination_dates[member_types == member_type]))
+        for member_type in ('Employee', 'Dependent', 'Retiree')
+    }
+    
+    # Month boundaries (month_end keeps the time of day of the generated dates)
+    month_ends = months
+    month_starts = months - pd.to_timedelta(months.day - 1, unit='D')
+    
+    # Actual costs from claims
+    medical_claims = monthly_claims['medical_claims'].to_numpy(dtype=float)
+    rx_claims = monthly_claims['rx_claims'].to_numpy(dtype=float)
+    
+    # Calculate enrollment for each month
+    employee_count = count_active(*sorted_dates['Employee'], month_starts, month_ends)
+    dependent_count = count_active(*sorted_dates['Dependent'], month_starts, month_ends)
+    retiree_count = count_active(*sorted_dates['Retiree'], month_starts, month_ends)
+    total_enrollment = employee_count + dependent_count + retiree_count
+    
+    # Fixed costs (relatively stable)
+    admin_fees = total_enrollment * rng.uniform(25, 35, MONTHS_OF_DATA)
+    stop_loss_premium = total_enrollment * rng.uniform(40, 50, MONTHS_OF_DATA)
+    wellness_programs = total_enrollment * rng.uniform(5, 10, MONTHS_OF_DATA)
+    
+    # Credits/reimbursements (variable)
+    stop_loss_reimb = np.where(medical_claims > 500000, (medical_claims - 500000) * 0.9, 0.0)
+    rx_rebates = rx_claims * rng.uniform(0.15, 0.25, MONTHS_OF_DATA)
+    
+    # Calculate totals
+    total_expenses = medical_claims + rx_claims + admin_fees + stop_loss_premium + wellness_programs
+    total_credits = stop_loss_reimb + rx_rebates
+    net_cost = total_expenses - total_credits
+    
+    # Budget (with some variance)
+    budget = net_cost * rng.uniform(0.95, 1.08, MONTHS_OF_DATA)
+    variance = budget - net_cost
+    variance_percent = np.divide(variance * 100, budget, out=np.zeros(MONTHS_OF_DATA), where=budget > 0)
+    
+    # Loss ratio
+    premiums = total_enrollment * 750  # Average premium
+    loss_ratio = np.divide((medical_claims + rx_claims) * 100, premiums,
+                           out=np.zeros(MONTHS_OF_DATA), where=premiums > 0)
+    
+    budget_df = pd.DataFrame({
+        'month': months.strftime('%b %Y'),
+        'budget': np.round(budget, 2),
+        'medical_claims': np.round(medical_claims, 2),
+        'rx_claims': np.round(rx_claims, 2),
+        'inpatient': np.round(monthly_claims['inpatient'].to_numpy(), 2),
+        'outpatient': np.round(monthly_claims['outpatient'].to_numpy(), 2),
+        'professional': np.round(monthly_claims['professional'].to_numpy(), 2),
+        'emergency': np.round(monthly_claims['emergency'].to_numpy(), 2),
+        'admin_fees': np.round(admin_fees, 2),
+        'stop_loss_premium': np.round(stop_loss_premium, 2),
+        'stop_loss_reimb': np.round(stop_loss_reimb, 2),
+        'rx_rebates': np.round(rx_rebates, 2),
+        'wellness_programs': np.round(wellness_programs, 2),
+        'domestic_claims': np.round(monthly_claims['domestic_claims'].to_numpy(), 2),
+        'non_domestic_claims': np.round(monthly_claims['non_domestic_claims'].to_numpy(), 2),
+        'employee_count': employee_count.astype('int32'),
+        'dependent_count': dependent_count.astype('int32'),
+        'retiree_count': retiree_count.astype('int32'),
+        'total_enrollment': total_enrollment.astype('int32'),
+        'loss_ratio': np.round(loss_ratio, 2),
+        'net_cost': np.round(net_cost, 2),
+        'variance': np.round(variance, 2),
+        'variance_percent': np.round(variance_percent, 2),
+        'created_at': months.strftime('%Y-%m-%d %H:%M:%S'),
+        'updated_at': now_str
+    })
     
-    budget_data = []
-    
-    for month_date in months:
-        month_str = month_date.strftime('%b %Y')
-        month_start = month_date.replace(day=1)
-        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-        
-        # Filter claims for this month
-        month_claims = claims_df[
-            (pd.to_datetime(claims_df['service_date']) >= month_start) & 
-            (pd.to_datetime(claims_df['service_date']) <= month_end)
-        ]
-        
-        # Calculate actual costs from claims
-        medical_claims = month_claims[month_claims['Service Type'] != 'Pharmacy']['Medical'].sum()
-        rx_claims = month_claims[month_claims['Service Type'] == 'Pharmacy']['Rx'].sum()
-        
-        # Break down medical claims
-        inpatient = month_claims[month_claims['Service Type'] == 'Inpatient']['Medical'].sum()
-        outpatient = month_claims[month_claims['Service Type'] == 'Outpatient']['Medical'].sum()
-        professional = month_claims[month_claims['Service Type'] == 'Professional']['Medical'].sum()
-        emergency = month_claims[month_claims['Service Type'] == 'Emergency']['Medical'].sum()
-        
-        # Geographic breakdown
-        domestic_claims = month_claims[month_claims['domestic_flag'] == True]['Total'].sum()
-        non_domestic_claims = month_claims[month_claims['domestic_flag'] == False]['Total'].sum()
-        
-        # Calculate enrollment for this month
-        active_members = members_df[
-            (pd.to_datetime(members_df['enrollment_date']) <= month_end) &
-            ((members_df['termination_date'].isna()) | (pd.to_datetime(members_df['termination_date']) >= month_start))
-        ]
-        
-        employee_count = len(active_members[active_members['member_type'] == 'Employee'])
-        dependent_count = len(active_members[active_members['member_type'] == 'Dependent'])
-        retiree_count = len(active_members[active_members['member_type'] == 'Retiree'])
-        total_enrollment = len(active_members)
-        
-        # Fixed costs (relatively stable)
-        admin_fees = total_enrollment * random.uniform(25, 35)
-        stop_loss_premium = total_enrollment * random.uniform(40, 50)
-        wellness_programs = total_enrollment * random.uniform(5, 10)
-        
-        # Credits/reimbursements (variable)
-        stop_loss_reimb = max(0, (medical_claims - 500000) * 0.9) if medical_claims > 500000 else 0
-        rx_rebates = rx_claims * random.uniform(0.15, 0.25)
-        
-        # Calculate totals
-        total_expenses = medical_claims + rx_claims + admin_fees + stop_loss_premium + wellness_programs
-        total_credits = stop_loss_reimb + rx_rebates
-        net_cost = total_expenses - total_credits
-        
-        # Budget (with some variance)
-        budget = net_cost * random.uniform(0.95, 1.08)
-        variance = budget - net_cost
-        variance_percent = (variance / budget * 100) if budget > 0 else 0
-        
-        # Loss ratio
-        premiums = total_enrollment * 750  # Average premium
-        loss_ratio = (medical_claims + rx_claims) / premiums * 100 if premiums > 0 else 0
-        
-        budget_data.append({
-            'month': month_str,
-            'budget': round(budget, 2),
-            'medical_claims': round(medical_claims, 2),
-            'rx_claims': round(rx_claims, 2),
-            'inpatient': round(inpatient, 2),
-            'outpatient': round(outpatient, 2),
-            'professional': round(professional, 2),
-            'emergency': round(emergency, 2),
-            'admin_fees': round(admin_fees, 2),
-            'stop_loss_premium': round(stop_loss_premium, 2),
-            'stop_loss_reimb': round(stop_loss_reimb, 2),
-            'rx_rebates': round(rx_rebates, 2),
-            'wellness_programs': round(wellness_programs, 2),
-            'domestic_claims': round(domestic_claims, 2),
-            'non_domestic_claims': round(non_domestic_claims, 2),
-            'employee_count': employee_count,
-            'dependent_count': dependent_count,
-            'retiree_count': retiree_count,
-            'total_enrollment': total_enrollment,
-            'loss_ratio': round(loss_ratio, 2),
-            'net_cost': round(net_cost, 2),
-            'variance': round(variance, 2),
-            'variance_percent': round(variance_percent, 2),
-            'created_at': month_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    return pd.DataFrame(budget_data)
-
-def main():
+    return budget_df
+
+def write_frame(df: pd.DataFrame, path: str, fmt: str) -> None:
+    """Write a frame as CSV or zstd-compressed Parquet."""
+    if fmt == "parquet":
+        df.to_parquet(path, index=False, compression="zstd")
+    else:
+        df.to_csv(path, index=False)
+
+def main(argv=None):
     """Main function to generate all sample data"""
+    parser = argparse.ArgumentParser(description="Generate healthcare analytics sample data.")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="output file format (default: csv, which the dashboard loads)")
+    fmt = parser.parse_args(argv).format
+    
     print("="*60)
     print("Healthcare Analytics Sample Data Generator")
     print("="*60)
@@ -482,6 +588,10 @@ def main():
     os.makedirs('sample_data/main_data', exist_ok=True)
     os.makedirs('sample_data/reference_data', exist_ok=True)
 
+    # Reference data and providers do not depend on each other, but each takes
+    # only milliseconds; a process pool costs more to start than it would save,
+    # and workers would share copies of the seeded rng state.
+    
     # Generate reference data
     service_types_df, icd10_df, plan_types_df, regions_df, employer_df = generate_reference_data()
     
@@ -489,29 +599,36 @@ def main():
     providers_df = generate_providers()
     
     # Generate members
-    members_df = generate_members(employer_df, plan_types_df)
+    members_df, member_dates = generate_members(employer_df, plan_types_df)
     
     # Generate claims
-    claims_df = generate_claims(members_df, providers_df, icd10_df, service_types_df)
+    claims_df, service_dates = generate_claims(members_df, providers_df, icd10_df, service_types_df,
+                                               member_dates)
     
     # Generate budget data
-    budget_df = generate_budget_data(claims_df, members_df)
+    budget_df = generate_budget_data(claims_df, members_df, service_dates, member_dates)
     
     # Save all files
-    print("\nSaving CSV files...")
+    print(f"\nSaving {fmt.upper()} files...")
 
-    # Main data files
-    budget_df.to_csv('sample_data/main_data/budget_data.csv', index=False)
-    claims_df.to_csv('sample_data/main_data/claims_data.csv', index=False)
-    members_df.to_csv('sample_data/main_data/members.csv', index=False)
+    output_files = [
+        # Main data files
+        (budget_df, f'sample_data/main_data/budget_data.{fmt}'),
+        (claims_df, f'sample_data/main_data/claims_data.{fmt}'),
+        (members_df, f'sample_data/main_data/members.{fmt}'),
+        # Reference data files
+        (providers_df, f'sample_data/reference_data/providers.{fmt}'),
+        (icd10_df, f'sample_data/reference_data/icd10_codes.{fmt}'),
+        (plan_types_df, f'sample_data/reference_data/plan_types.{fmt}'),
+        (service_types_df, f'sample_data/reference_data/service_types.{fmt}'),
+        (regions_df, f'sample_data/reference_data/geographic_regions.{fmt}'),
+        (employer_df, f'sample_data/reference_data/employer_groups.{fmt}')
+    ]
     
-    # Reference data files
-    providers_df.to_csv('sample_data/reference_data/providers.csv', index=False)
-    icd10_df.to_csv('sample_data/reference_data/icd10_codes.csv', index=False)
-    plan_types_df.to_csv('sample_data/reference_data/plan_types.csv', index=False)
-    service_types_df.to_csv('sample_data/reference_data/service_types.csv', index=False)
-    regions_df.to_csv('sample_data/reference_data/geographic_regions.csv', index=False)
-    employer_df.to_csv('sample_data/reference_data/employer_groups.csv', index=False)
+    # The CSV writer formats values while holding the GIL, so CSV files gain
+    # nothing from the pool; pyarrow releases it, so Parquet writes overlap
+    with ThreadPoolExecutor(max_workers=len(output_files)) as executor:
+        list(executor.map(lambda job: write_frame(*job, fmt), output_files))
     
     # Print summary
     print("\n" + "="*60)
@@ -519,16 +636,16 @@ def main():
     print("="*60)
     print(f"\nFiles created in sample_data/ directory:")
     print(f"  Main Data:")
-    print(f"    - budget_data.csv: {len(budget_df)} months")
-    print(f"    - claims_data.csv: {len(claims_df)} claims")
-    print(f"    - members.csv: {len(members_df)} members")
+    print(f"    - budget_data.{fmt}: {len(budget_df)} months")
+    print(f"    - claims_data.{fmt}: {len(claims_df)} claims")
+    print(f"    - members.{fmt}: {len(members_df)} members")
     print(f"  Reference Data:")
-    print(f"    - providers.csv: {len(providers_df)} providers")
-    print(f"    - icd10_codes.csv: {len(icd10_df)} diagnosis codes")
-    print(f"    - plan_types.csv: {len(plan_types_df)} plans")
-    print(f"    - service_types.csv: {len(service_types_df)} service types")
-    print(f"    - geographic_regions.csv: {len(regions_df)} regions")
-    print(f"    - employer_groups.csv: {len(employer_df)} employers")
+    print(f"    - providers.{fmt}: {len(providers_df)} providers")
+    print(f"    - icd10_codes.{fmt}: {len(icd10_df)} diagnosis codes")
+    print(f"    - plan_types.{fmt}: {len(plan_types_df)} plans")
+    print(f"    - service_types.{fmt}: {len(service_types_df)} service types")
+    print(f"    - geographic_regions.{fmt}: {len(regions_df)} regions")
+    print(f"    - employer_groups.{fmt}: {len(employer_df)} employers")
     
     # Create sample analysis
     print("\n" + "="*60)